@@ -15,6 +15,16 @@ sys.path.insert(0, str(project_root))
 from src.utils.config import config
 from tests.deepeval_config import AGENT_MODEL, EVAL_MODEL, METRIC_THRESHOLDS, CUSTOM_THRESHOLDS
 
+# Environment variable prefix for threshold overrides
+THRESHOLD_ENV_PREFIX = "EVAL_THRESHOLD_"
+
+
+def print_thresholds(thresholds: dict, overridden: set):
+    """Print thresholds, marking those overridden via environment"""
+    for metric, threshold in thresholds.items():
+        status = "(custom)" if metric.upper() in overridden else "(default)"
+        print(f"    {metric}: {threshold} {status}")
+
 
 def check_config():
     """Check Configuration"""
@@ -49,19 +59,17 @@ def check_config():
 
     # Check evaluation thresholds
     print("\n📊 Evaluation Threshold Configuration:")
+    # Metrics overridden via environment, collected in one pass
+    overridden = {
+        key[len(THRESHOLD_ENV_PREFIX):]
+        for key in os.environ
+        if key.startswith(THRESHOLD_ENV_PREFIX)
+    }
     print("  Standard Metrics:")
-    for metric, threshold in METRIC_THRESHOLDS.items():
-        env_var = f"EVAL_THRESHOLD_{metric.upper()}"
-        is_default = os.getenv(env_var) is None
-        status = "(default)" if is_default else "(custom)"
-        print(f"    {metric}: {threshold} {status}")
+    print_thresholds(METRIC_THRESHOLDS, overridden)
 
     print("\n  Custom Metrics:")
-    for metric, threshold in CUSTOM_THRESHOLDS.items():
-        env_var = f"EVAL_THRESHOLD_{metric.upper()}"
-        is_default = os.getenv(env_var) is None
-        status = "(default)" if is_default else "(custom)"
-        print(f"    {metric}: {threshold} {status}")
+    print_thresholds(CUSTOM_THRESHOLDS, overridden)
 
     # Verify consistency
     print("\n✅ Verification:")
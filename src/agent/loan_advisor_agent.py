@@ -167,7 +167,7 @@ loan_advisor_agent = Agent(
     markdown=not IS_STRUCTURED
 )
 
-logger.info(f"Output mode: {OUTPUT_MODE.value}")
+logger.info("Output mode: %s", OUTPUT_MODE.value)
 if IS_STRUCTURED:
     logger.info("Using LoanAdvisorResponse model with temperature=0.0")
 else:
@@ -197,7 +197,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-logger.info(f"CORS configured with allowed origins: {allowed_origins}")
+logger.info("CORS configured with allowed origins: %s", allowed_origins)
 
 # The AgentOS UI will automatically:
 # 1. Create a chat interface at http://localhost:3000
@@ -234,4 +234,5 @@ if __name__ == "__main__":
         print("=" * 60)
 
         # Run agent as an interactive CLI app using the existing instance
-        loan_advisor_agent.cli_app(stream=True)
\ No newline at end of file
+        # Stream only to a terminal; piped/scripted output gets whole responses
+        loan_advisor_agent.cli_app(stream=sys.stdout.isatty())
\ No newline at end of file
@@ -12,19 +12,16 @@ from src.tools.loan_eligibility import (
     LoanEligibilityTool,
     ApplicantInfo,
     EmploymentStatus,
-    get_eligibility_checker,
 )
 from src.tools.loan_calculator import (
     LoanCalculatorTool,
     LoanRequest,
-    get_calculator,
     calculate_home_affordability,
     calculate_mortgage_payment,
     calculate_car_loan,
     compare_car_loan_terms,
     calculate_early_payoff,
 )
-from src.tools.loan_types import LoanType
 from src.utils.config import config
 from src.utils.logger import get_logger
 
@@ -44,6 +41,9 @@ eligibility_checker = LoanEligibilityTool(
 
 loan_calculator = LoanCalculatorTool(max_dti_ratio=config.loan.max_dti_ratio)
 
+# Employment status string -> enum, built once
+EMPLOYMENT_STATUS_MAP = {status.value: status for status in EmploymentStatus}
+
 
 @tool(name="check_loan_eligibility", show_result=True)
 def check_loan_eligibility(
@@ -80,14 +80,7 @@ def check_loan_eligibility(
     """
     try:
         # Map employment status string to enum
-        emp_status_map = {
-            "full_time": EmploymentStatus.FULL_TIME,
-            "part_time": EmploymentStatus.PART_TIME,
-            "self_employed": EmploymentStatus.SELF_EMPLOYED,
-            "unemployed": EmploymentStatus.UNEMPLOYED,
-            "retired": EmploymentStatus.RETIRED,
-        }
-        emp_status = emp_status_map.get(
+        emp_status = EMPLOYMENT_STATUS_MAP.get(
             employment_status.lower(), EmploymentStatus.FULL_TIME
         )
 
@@ -116,20 +109,18 @@ def check_loan_eligibility(
 
         if result.reasons:
             response += "### Assessment Details:\n"
-            for reason in result.reasons:
-                response += f"- {reason}\n"
+            response += "".join(f"- {reason}\n" for reason in result.reasons)
             response += "\n"
 
         if result.recommendations:
             response += "### Recommendations:\n"
-            for rec in result.recommendations:
-                response += f"- {rec}\n"
+            response += "".join(f"- {rec}\n" for rec in result.recommendations)
 
-        logger.info(f"Eligibility check completed for age={age}, score={result.score}")
+        logger.info("Eligibility check completed for age=%s, score=%s", age, result.score)
         return response
 
     except Exception as e:
-        logger.error(f"Error in eligibility check: {str(e)}")
+        logger.error("Error in eligibility check: %s", e)
         return f"Error checking eligibility: {str(e)}"
 
 
@@ -170,11 +161,11 @@ def calculate_loan_payment(
         response += f"**Total Interest**: ${calc.total_interest:,.2f}\n"
         response += f"**Interest as % of Principal**: {(calc.total_interest/calc.total_principal)*100:.1f}%\n"
 
-        logger.info(f"Payment calculation: amount=${loan_amount}, payment=${calc.monthly_payment}")
+        logger.info("Payment calculation: amount=$%s, payment=$%s", loan_amount, calc.monthly_payment)
         return response
 
     except Exception as e:
-        logger.error(f"Error calculating payment: {str(e)}")
+        logger.error("Error calculating payment: %s", e)
         return f"Error calculating payment: {str(e)}"
 
 
@@ -216,14 +207,14 @@ def generate_payment_schedule(
         response += "| Month | Payment | Principal | Interest | Remaining Balance |\n"
         response += "|-------|---------|-----------|----------|-------------------|\n"
 
-        for _, row in df_subset.iterrows():
-            response += (
-                f"| {int(row['month'])} | "
-                f"${row['payment']:,.2f} | "
-                f"${row['principal']:,.2f} | "
-                f"${row['interest']:,.2f} | "
-                f"${row['balance']:,.2f} |\n"
-            )
+        response += "".join(
+            f"| {int(row['month'])} | "
+            f"${row['payment']:,.2f} | "
+            f"${row['principal']:,.2f} | "
+            f"${row['interest']:,.2f} | "
+            f"${row['balance']:,.2f} |\n"
+            for _, row in df_subset.iterrows()
+        )
 
         if loan_term_months > show_first_n_months:
             response += f"\n... ({loan_term_months - show_first_n_months} more months)\n\n"
@@ -234,11 +225,11 @@ def generate_payment_schedule(
             response += f"${last_row['payment']:,.2f} payment, "
             response += f"Balance: ${last_row['balance']:,.2f}\n"
 
-        logger.info(f"Generated payment schedule for ${loan_amount} over {loan_term_months} months")
+        logger.info("Generated payment schedule for $%s over %s months", loan_amount, loan_term_months)
         return response
 
     except Exception as e:
-        logger.error(f"Error generating schedule: {str(e)}")
+        logger.error("Error generating schedule: %s", e)
         return f"Error generating schedule: {str(e)}"
 
 
@@ -292,11 +283,11 @@ def check_loan_affordability(
         )
         response += f"### Analysis:\n{result['message']}\n"
 
-        logger.info(f"Affordability check: DTI={result['dti_ratio']*100:.1f}%, affordable={result['affordable']}")
+        logger.info("Affordability check: DTI=%.1f%%, affordable=%s", result['dti_ratio']*100, result['affordable'])
         return response
 
     except Exception as e:
-        logger.error(f"Error checking affordability: {str(e)}")
+        logger.error("Error checking affordability: %s", e)
         return f"Error checking affordability: {str(e)}"
 
 
@@ -338,24 +329,24 @@ def compare_loan_terms(
             "|------|----------------|---------------|----------------|---------------|\n"
         )
 
-        for _, row in comparison.iterrows():
-            response += (
-                f"| {int(row['term_months'])} months ({row['term_years']:.1f} yrs) | "
-                f"${row['monthly_payment']:,.2f} | "
-                f"${row['total_payment']:,.2f} | "
-                f"${row['total_interest']:,.2f} | "
-                f"{row['interest_percentage']:.1f}% |\n"
-            )
+        response += "".join(
+            f"| {int(row['term_months'])} months ({row['term_years']:.1f} yrs) | "
+            f"${row['monthly_payment']:,.2f} | "
+            f"${row['total_payment']:,.2f} | "
+            f"${row['total_interest']:,.2f} | "
+            f"{row['interest_percentage']:.1f}% |\n"
+            for _, row in comparison.iterrows()
+        )
 
         response += "\n### Key Insights:\n"
         response += "- **Shorter terms**: Higher monthly payment, less total interest\n"
         response += "- **Longer terms**: Lower monthly payment, more total interest\n"
 
-        logger.info(f"Compared {len(term_options)} loan terms for ${loan_amount}")
+        logger.info("Compared %s loan terms for $%s", len(term_options), loan_amount)
         return response
 
     except Exception as e:
-        logger.error(f"Error comparing terms: {str(e)}")
+        logger.error("Error comparing terms: %s", e)
         return f"Error comparing terms: {str(e)}"
 
 
@@ -402,11 +393,11 @@ def calculate_max_affordable_loan(
             response += f"❌ **Cannot afford additional loan**\n\n"
             response += f"{result['message']}\n"
 
-        logger.info(f"Max loan calculation: income=${monthly_income}, max=${result.get('max_loan_amount', 0)}")
+        logger.info("Max loan calculation: income=$%s, max=$%s", monthly_income, result.get('max_loan_amount', 0))
         return response
 
     except Exception as e:
-        logger.error(f"Error calculating max loan: {str(e)}")
+        logger.error("Error calculating max loan: %s", e)
         return f"Error calculating max loan: {str(e)}"
 
 
@@ -468,11 +459,11 @@ def calculate_home_affordability_tool(
         response += f"**Max LTV for {residency}/{property_type}**: {result['ltv_ratio']:.0%}\n\n"
         response += f"### Summary:\n{result['message']}\n"
 
-        logger.info(f"Home affordability: {residency}/{property_type}, income=${monthly_income}, max_home=${result['max_home_price']}")
+        logger.info("Home affordability: %s/%s, income=$%s, max_home=$%s", residency, property_type, monthly_income, result['max_home_price'])
         return response
 
     except Exception as e:
-        logger.error(f"Error calculating home affordability: {str(e)}")
+        logger.error("Error calculating home affordability: %s", e)
         return f"Error calculating home affordability: {str(e)}"
 
 
@@ -525,11 +516,11 @@ def calculate_mortgage_payment_tool(
         response += f"**Total Payment**: ${result['total_payment']:,.0f}\n"
         response += f"**Total Interest**: ${result['total_interest']:,.0f}\n"
 
-        logger.info(f"Mortgage calc: {residency}/{property_type}, home=${home_price}, payment=${result['monthly_payment']}")
+        logger.info("Mortgage calc: %s/%s, home=$%s, payment=$%s", residency, property_type, home_price, result['monthly_payment'])
         return response
 
     except Exception as e:
-        logger.error(f"Error calculating mortgage: {str(e)}")
+        logger.error("Error calculating mortgage: %s", e)
         return f"Error calculating mortgage: {str(e)}"
 
 
@@ -577,11 +568,11 @@ def calculate_car_loan_tool(
         response += f"**Total Payment**: ${result['total_payment']:,.0f}\n"
         response += f"**Total Interest**: ${result['total_interest']:,.0f}\n"
 
-        logger.info(f"Car loan calc: price=${car_price}, payment=${result['monthly_payment']}")
+        logger.info("Car loan calc: price=$%s, payment=$%s", car_price, result['monthly_payment'])
         return response
 
     except Exception as e:
-        logger.error(f"Error calculating car loan: {str(e)}")
+        logger.error("Error calculating car loan: %s", e)
         return f"Error calculating car loan: {str(e)}"
 
 
@@ -621,25 +612,25 @@ def compare_car_loan_terms_tool(
             "|------|----------------|---------------|----------------|------------|\n"
         )
 
-        for _, row in comparison.iterrows():
-            response += (
-                f"| {int(row['term_months'])} mo ({row['term_years']:.1f} yr) | "
-                f"${row['monthly_payment']:,.2f} | "
-                f"${row['total_payment']:,.0f} | "
-                f"${row['total_interest']:,.0f} | "
-                f"{row['interest_percentage']:.1f}% |\n"
-            )
+        response += "".join(
+            f"| {int(row['term_months'])} mo ({row['term_years']:.1f} yr) | "
+            f"${row['monthly_payment']:,.2f} | "
+            f"${row['total_payment']:,.0f} | "
+            f"${row['total_interest']:,.0f} | "
+            f"{row['interest_percentage']:.1f}% |\n"
+            for _, row in comparison.iterrows()
+        )
 
         response += "\n### Key Insights:\n"
         response += "- **Shorter terms (36-48 mo)**: Higher payment, less interest\n"
         response += "- **Longer terms (60-72 mo)**: Lower payment, more interest\n"
         response += "- Consider your budget and total cost when choosing\n"
 
-        logger.info(f"Compared car loan terms for ${car_price}")
+        logger.info("Compared car loan terms for $%s", car_price)
         return response
 
     except Exception as e:
-        logger.error(f"Error comparing car loan terms: {str(e)}")
+        logger.error("Error comparing car loan terms: %s", e)
         return f"Error comparing car loan terms: {str(e)}"
 
 
@@ -693,11 +684,11 @@ def calculate_early_payoff_tool(
 
         response += f"### Summary:\n{result['message']}\n"
 
-        logger.info(f"Early payoff: extra=${extra_monthly_payment}, saved=${result['interest_saved']}")
+        logger.info("Early payoff: extra=$%s, saved=$%s", extra_monthly_payment, result['interest_saved'])
         return response
 
     except Exception as e:
-        logger.error(f"Error calculating early payoff: {str(e)}")
+        logger.error("Error calculating early payoff: %s", e)
         return f"Error calculating early payoff: {str(e)}"
 
 
@@ -13,13 +13,11 @@ Usage:
     output = formatter.format_payment(payment_data)
 """
 
-from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, Protocol, runtime_checkable
 import os
 
 from src.agent.response_models import (
-    LoanAdvisorResponse,
     EligibilityResult,
     PaymentResult,
     AffordabilityResult,
@@ -128,14 +126,12 @@ class MarkdownFormatter:
 
         if data.get("reasons"):
             response += "### Assessment Details:\n"
-            for reason in data["reasons"]:
-                response += f"- {reason}\n"
+            response += "".join(f"- {reason}\n" for reason in data["reasons"])
             response += "\n"
 
         if data.get("recommendations"):
             response += "### Recommendations:\n"
-            for rec in data["recommendations"]:
-                response += f"- {rec}\n"
+            response += "".join(f"- {rec}\n" for rec in data["recommendations"])
 
         return response
 
@@ -186,14 +182,14 @@ class MarkdownFormatter:
         response += "|-------|---------|-----------|----------|-------------------|\n"
 
         df_subset = schedule_df.head(show_months)
-        for _, row in df_subset.iterrows():
-            response += (
-                f"| {int(row['month'])} | "
-                f"${row['payment']:,.2f} | "
-                f"${row['principal']:,.2f} | "
-                f"${row['interest']:,.2f} | "
-                f"${row['balance']:,.2f} |\n"
-            )
+        response += "".join(
+            f"| {int(row['month'])} | "
+            f"${row['payment']:,.2f} | "
+            f"${row['principal']:,.2f} | "
+            f"${row['interest']:,.2f} | "
+            f"${row['balance']:,.2f} |\n"
+            for _, row in df_subset.iterrows()
+        )
 
         if total_months > show_months:
             response += f"\n... ({total_months - show_months} more months)\n\n"
@@ -213,14 +209,14 @@ class MarkdownFormatter:
         response += "| Term | Monthly Payment | Total Payment | Total Interest | Interest % |\n"
         response += "|------|----------------|---------------|----------------|------------|\n"
 
-        for _, row in comparison_df.iterrows():
-            response += (
-                f"| {int(row['term_months'])} mo ({row['term_years']:.1f} yr) | "
-                f"${row['monthly_payment']:,.2f} | "
-                f"${row['total_payment']:,.2f} | "
-                f"${row['total_interest']:,.2f} | "
-                f"{row['interest_percentage']:.1f}% |\n"
-            )
+        response += "".join(
+            f"| {int(row['term_months'])} mo ({row['term_years']:.1f} yr) | "
+            f"${row['monthly_payment']:,.2f} | "
+            f"${row['total_payment']:,.2f} | "
+            f"${row['total_interest']:,.2f} | "
+            f"{row['interest_percentage']:.1f}% |\n"
+            for _, row in comparison_df.iterrows()
+        )
 
         response += "\n### Key Insights:\n"
         response += "- **Shorter terms**: Higher monthly payment, less total interest\n"
@@ -13,7 +13,7 @@ Why use numpy-financial?
 - Well-tested and maintained by the community
 """
 
-from typing import Protocol
+from functools import lru_cache
 
 import numpy as np
 import numpy_financial as npf
@@ -49,12 +49,27 @@ class FinancialEngine:
         Returns:
             Monthly payment amount
         """
+        return _payment(principal, rate, periods)
+
+    def payments(self, principal: float, rate: float, periods: np.ndarray) -> np.ndarray:
+        """Calculate monthly payments for several loan terms at once.
+
+        Vectorized form of payment() for comparing term options.
+
+        Args:
+            principal: Loan amount
+            rate: Annual interest rate (e.g., 0.05 for 5%)
+            periods: Array of loan terms in months
+
+        Returns:
+            Array of monthly payment amounts, one per term
+        """
+        periods = np.asarray(periods)
         if rate == 0:
             return principal / periods
 
         monthly_rate = rate / 12
-        # npf.pmt returns negative (cash outflow), we return positive
-        return float(-npf.pmt(monthly_rate, periods, principal))
+        return -npf.pmt(monthly_rate, periods, principal)
 
     def max_principal(self, payment: float, rate: float, periods: int) -> float:
         """Calculate maximum principal for a given monthly payment.
@@ -69,12 +84,13 @@ class FinancialEngine:
         Returns:
             Maximum loan amount (principal)
         """
-        if rate == 0:
-            return payment * periods
+        return _max_principal(payment, rate, periods)
 
-        monthly_rate = rate / 12
-        # npf.pv calculates present value (principal)
-        return float(-npf.pv(monthly_rate, periods, payment))
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the memoized payment / max_principal results."""
+        _payment.cache_clear()
+        _max_principal.cache_clear()
 
     def interest_payment(self, principal: float, rate: float, period: int, periods: int) -> float:
         """Calculate interest portion for a specific period.
@@ -200,5 +216,35 @@ class FinancialEngine:
         })
 
 
+# =============================================================================
+# Memoized scalar calculations
+# =============================================================================
+# Agent conversations replay the same (amount, rate, term) scenarios across
+# tools, so the scalar npf calls are cached. Results are plain floats.
+# Keys are the exact inputs: rates are not quantized, so a cached result is
+# always identical to computing it fresh.
+
+@lru_cache(maxsize=4096)
+def _payment(principal: float, rate: float, periods: int) -> float:
+    """Cached implementation of FinancialEngine.payment."""
+    if rate == 0:
+        return principal / periods
+
+    monthly_rate = rate / 12
+    # npf.pmt returns negative (cash outflow), we return positive
+    return float(-npf.pmt(monthly_rate, periods, principal))
+
+
+@lru_cache(maxsize=4096)
+def _max_principal(payment: float, rate: float, periods: int) -> float:
+    """Cached implementation of FinancialEngine.max_principal."""
+    if rate == 0:
+        return payment * periods
+
+    monthly_rate = rate / 12
+    # npf.pv calculates present value (principal)
+    return float(-npf.pv(monthly_rate, periods, payment))
+
+
 # Module-level shared instance - stateless, safe to share
 engine = FinancialEngine()
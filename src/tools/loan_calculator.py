@@ -19,18 +19,24 @@ Refactored to use numpy-financial via FinancialEngine for:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
 from .financial import engine
 from .loan_types import LoanType
-from .loan_rules import get_mortgage_rule, get_auto_loan_rule
+from .loan_rules import get_mortgage_rule
 from ..utils.config import config
 
 
-@dataclass
+# Longest supported loan term (30-year mortgage)
+MAX_TERM_MONTHS = 360
+
+
+@dataclass(slots=True)
 class LoanCalculation:
     """Result of loan calculation."""
 
@@ -43,7 +49,7 @@ class LoanCalculation:
     effective_monthly_rate: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AmortizationSchedule:
     """Loan amortization schedule."""
 
@@ -58,7 +64,7 @@ class LoanRequest(BaseModel):
     annual_interest_rate: float = Field(
         ..., ge=0, le=1, description="Annual interest rate (e.g., 0.0499 for 4.99%)"
     )
-    loan_term_months: int = Field(..., gt=0, le=360, description="Loan term in months")
+    loan_term_months: int = Field(..., gt=0, le=MAX_TERM_MONTHS, description="Loan term in months")
     monthly_income: Optional[float] = Field(
         None, gt=0, description="Monthly income for affordability check"
     )
@@ -208,26 +214,28 @@ class LoanCalculatorTool:
         Returns:
             DataFrame comparing different loan terms
         """
-        comparisons = []
+        if not terms:
+            return pd.DataFrame()
 
-        for term in terms:
-            loan_request = LoanRequest(
-                loan_amount=loan_amount, annual_interest_rate=annual_rate, loan_term_months=term
-            )
-            calc = self.calculate_monthly_payment(loan_request)
-
-            comparisons.append(
-                {
-                    "term_months": term,
-                    "term_years": term / 12,
-                    "monthly_payment": calc.monthly_payment,
-                    "total_payment": calc.total_payment,
-                    "total_interest": calc.total_interest,
-                    "interest_percentage": (calc.total_interest / loan_amount) * 100,
-                }
-            )
+        # Validate amount and rate once; terms are checked against the same bounds
+        LoanRequest(
+            loan_amount=loan_amount, annual_interest_rate=annual_rate, loan_term_months=terms[0]
+        )
+        term_months = _validate_terms(terms)
 
-        return pd.DataFrame(comparisons)
+        # All terms in one vectorized calculation
+        monthly_payment = engine.payments(loan_amount, annual_rate, term_months)
+        total_payment = monthly_payment * term_months
+        total_interest = total_payment - loan_amount
+
+        return pd.DataFrame({
+            "term_months": term_months,
+            "term_years": term_months / 12,
+            "monthly_payment": monthly_payment,
+            "total_payment": total_payment,
+            "total_interest": total_interest,
+            "interest_percentage": (total_interest / loan_amount) * 100,
+        })
 
     def calculate_max_loan_amount(
         self,
@@ -541,27 +549,36 @@ def compare_car_loan_terms(
         down_payment = car_price * cfg.min_down_payment
 
     loan_amount = car_price - down_payment
-    comparisons = []
 
-    for term in terms:
-        monthly_payment = engine.payment(
-            principal=loan_amount,
-            rate=annual_interest_rate,
-            periods=term,
-        )
-        total_payment = monthly_payment * term
-        total_interest = total_payment - loan_amount
+    # All terms in one vectorized calculation
+    term_months = _validate_terms(terms)
+    monthly_payment = engine.payments(loan_amount, annual_interest_rate, term_months)
+    total_payment = monthly_payment * term_months
+    total_interest = total_payment - loan_amount
+
+    return pd.DataFrame({
+        "term_months": term_months,
+        "term_years": term_months / 12,
+        "monthly_payment": _round_cents(monthly_payment),
+        "total_payment": _round_cents(total_payment),
+        "total_interest": _round_cents(total_interest),
+        "interest_percentage": _round_cents((total_interest / loan_amount) * 100),
+    })
 
-        comparisons.append({
-            "term_months": term,
-            "term_years": term / 12,
-            "monthly_payment": round(monthly_payment, 2),
-            "total_payment": round(total_payment, 2),
-            "total_interest": round(total_interest, 2),
-            "interest_percentage": round((total_interest / loan_amount) * 100, 2),
-        })
 
-    return pd.DataFrame(comparisons)
+def _validate_terms(terms: list[int]) -> np.ndarray:
+    """Convert loan terms to an int array, rejecting fractional or out-of-range terms."""
+    term_months = np.asarray(terms, dtype=int)
+    if term_months.tolist() != list(terms):
+        raise ValueError("Loan terms must be whole months")
+    if (term_months <= 0).any() or (term_months > MAX_TERM_MONTHS).any():
+        raise ValueError(f"Loan terms must be between 1 and {MAX_TERM_MONTHS} months")
+    return term_months
+
+
+def _round_cents(values: np.ndarray) -> list[float]:
+    """Round to 2 decimals with Python's round (np.round differs on ties)."""
+    return [round(value, 2) for value in values.tolist()]
 
 
 # =============================================================================
@@ -646,5 +663,11 @@ def get_calculator(loan_type: LoanType | str = LoanType.PERSONAL) -> LoanCalcula
     if isinstance(loan_type, str):
         loan_type = LoanType(loan_type.lower())
 
+    return _build_calculator(loan_type)
+
+
+@lru_cache(maxsize=None)
+def _build_calculator(loan_type: LoanType) -> LoanCalculatorTool:
+    """Build (once per loan type) the shared calculator instance."""
     loan_cfg = config.get_loan_config(loan_type.value)
     return LoanCalculatorTool(max_dti_ratio=loan_cfg.max_dti_ratio)
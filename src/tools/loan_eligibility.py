@@ -17,6 +17,7 @@ ensuring consistency with LoanCalculatorTool.
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -44,7 +45,7 @@ class EligibilityStatus(str, Enum):
     CONDITIONAL = "conditional"  # Eligible with conditions
 
 
-@dataclass
+@dataclass(slots=True)
 class EligibilityResult:
     """Result of loan eligibility check."""
 
@@ -595,6 +596,12 @@ def get_eligibility_checker(
     if isinstance(loan_type, str):
         loan_type = LoanType(loan_type.lower())
 
+    return _build_eligibility_checker(loan_type)
+
+
+@lru_cache(maxsize=None)
+def _build_eligibility_checker(loan_type: LoanType) -> LoanEligibilityTool:
+    """Build (once per loan type) the shared eligibility checker instance."""
     if loan_type == LoanType.MORTGAGE:
         return MortgageEligibilityTool()
     elif loan_type == LoanType.AUTO:
@@ -28,22 +28,12 @@ class LoanType(str, Enum):
     @property
     def display_name(self) -> str:
         """Human-readable name."""
-        names = {
-            LoanType.PERSONAL: "Personal Loan",
-            LoanType.MORTGAGE: "Mortgage / Home Loan",
-            LoanType.AUTO: "Auto / Car Loan",
-        }
-        return names[self]
+        return _DISPLAY_NAMES[self]
 
     @property
     def description(self) -> str:
         """Brief description."""
-        descriptions = {
-            LoanType.PERSONAL: "Unsecured loan for personal expenses",
-            LoanType.MORTGAGE: "Secured loan for property purchase",
-            LoanType.AUTO: "Secured loan for vehicle purchase",
-        }
-        return descriptions[self]
+        return _DESCRIPTIONS[self]
 
     @property
     def requires_collateral(self) -> bool:
@@ -53,9 +43,25 @@ class LoanType(str, Enum):
     @property
     def collateral_type(self) -> str | None:
         """Type of collateral required."""
-        types = {
-            LoanType.PERSONAL: None,
-            LoanType.MORTGAGE: "Real Estate",
-            LoanType.AUTO: "Vehicle",
-        }
-        return types[self]
+        return _COLLATERAL_TYPES[self]
+
+
+# Lookup tables for LoanType properties (module-level: names defined inside
+# an Enum body would become members)
+_DISPLAY_NAMES = {
+    LoanType.PERSONAL: "Personal Loan",
+    LoanType.MORTGAGE: "Mortgage / Home Loan",
+    LoanType.AUTO: "Auto / Car Loan",
+}
+
+_DESCRIPTIONS = {
+    LoanType.PERSONAL: "Unsecured loan for personal expenses",
+    LoanType.MORTGAGE: "Secured loan for property purchase",
+    LoanType.AUTO: "Secured loan for vehicle purchase",
+}
+
+_COLLATERAL_TYPES = {
+    LoanType.PERSONAL: None,
+    LoanType.MORTGAGE: "Real Estate",
+    LoanType.AUTO: "Vehicle",
+}
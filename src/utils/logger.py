@@ -1,13 +1,19 @@
 """Centralized logging configuration for the Personal Loan Advisor Agent.
 
 This module provides a unified logging setup for all components.
+Loggers can optionally write through a shared background QueueListener
+(queued=True, or LOG_QUEUE=1 for get_logger), which moves console and file
+I/O off the calling thread. Records are still formatted by the caller.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
 
 
 class ColoredFormatter(logging.Formatter):
@@ -39,12 +45,69 @@ class ColoredFormatter(logging.Formatter):
         return result
 
 
+# Shared queue and listener for queued loggers. The listener routes each
+# record to the real handlers registered for the logger that queued it.
+_log_queue = queue.SimpleQueue()
+_queued_handlers: dict[str, list[logging.Handler]] = {}
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+class _OwnedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that tags records with the logger that owns it.
+
+    Records propagating up from child loggers keep the child's name, so
+    routing by record.name would miss the owner's handlers.
+    """
+
+    def __init__(self, owner: str):
+        super().__init__(_log_queue)
+        self.owner = owner
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.queue_owner = self.owner
+        return record
+
+
+class _HandlerDispatcher(logging.Handler):
+    """Dispatch queued records to the handlers of the logger that queued them."""
+
+    def handle(self, record):
+        for handler in _queued_handlers.get(record.queue_owner, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+def _start_listener() -> None:
+    """Start the shared background listener (once per process)."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = logging.handlers.QueueListener(_log_queue, _HandlerDispatcher())
+            _listener.start()
+
+
+def _stop_listener() -> None:
+    """Flush pending records and stop the shared background listener."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def setup_logger(
     name: str,
     level: str = "INFO",
     log_file: Optional[str] = None,
     console_output: bool = True,
     colored: bool = True,
+    queued: bool = False,
 ) -> logging.Logger:
     """Setup a logger with console and optional file output.
 
@@ -54,6 +117,7 @@ def setup_logger(
         log_file: Optional log file path
         console_output: Whether to output to console
         colored: Whether to use colored output in console
+        queued: Whether to write through the shared background QueueListener
 
     Returns:
         Configured logger instance
@@ -66,6 +130,15 @@ def setup_logger(
         # Clear existing handlers for reconfiguration
         logger.handlers.clear()
 
+    if name in _queued_handlers:
+        # Flush records still queued for the old handlers before replacing them
+        _stop_listener()
+        del _queued_handlers[name]
+        if _queued_handlers:
+            _start_listener()
+
+    handlers = []
+
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
@@ -83,7 +156,7 @@ def setup_logger(
             )
 
         console_handler.setFormatter(console_format)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler
     if log_file:
@@ -99,7 +172,16 @@ def setup_logger(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if queued and handlers:
+        # Callers enqueue; handler I/O happens on the shared listener thread
+        _queued_handlers[name] = handlers
+        _start_listener()
+        logger.addHandler(_OwnedQueueHandler(name))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     # Prevent propagation to root logger
     logger.propagate = False
@@ -132,12 +214,16 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     # Check if file logging is enabled
     log_file = os.getenv('LOG_FILE', None)
 
+    # Opt-in background writing (e.g. for the API server); off for the CLI
+    queued = os.getenv('LOG_QUEUE', '').lower() in ('1', 'true', 'yes')
+
     return setup_logger(
         name=name,
         level=default_level,
         log_file=log_file,
         console_output=True,
-        colored=True
+        colored=True,
+        queued=queued,
     )
 
 
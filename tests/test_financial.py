@@ -0,0 +1,48 @@
+"""Unit tests for the financial calculation engine."""
+
+import pytest
+from src.tools.financial import FinancialEngine, _max_principal, _payment
+
+
+class TestMemoization:
+    """Cached scalar calculation tests"""
+
+    @pytest.fixture
+    def engine(self):
+        FinancialEngine.cache_clear()
+        yield FinancialEngine()
+        FinancialEngine.cache_clear()
+
+    def test_repeated_payment_hits_cache(self, engine):
+        """Test a repeated payment call is served from the cache"""
+        first = engine.payment(50000, 0.05, 36)
+        second = engine.payment(50000, 0.05, 36)
+
+        assert first == second
+        info = _payment.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_distinct_rates_are_not_merged(self, engine):
+        """Test rates are keyed exactly, without quantization"""
+        engine.payment(50000, 0.05, 36)
+        engine.payment(50000, 0.0500001, 36)
+
+        info = _payment.cache_info()
+        assert (info.hits, info.misses) == (0, 2)
+
+    def test_repeated_max_principal_hits_cache(self, engine):
+        """Test a repeated max_principal call is served from the cache"""
+        engine.max_principal(1500, 0.05, 36)
+        engine.max_principal(1500, 0.05, 36)
+
+        info = _max_principal.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_cache_clear_resets_both_caches(self, engine):
+        """Test cache_clear empties payment and max_principal caches"""
+        engine.payment(50000, 0.05, 36)
+        engine.max_principal(1500, 0.05, 36)
+        FinancialEngine.cache_clear()
+
+        assert _payment.cache_info().currsize == 0
+        assert _max_principal.cache_info().currsize == 0
@@ -347,6 +347,12 @@ class TestCompareCarLoanTerms:
         assert short_term["monthly_payment"] > long_term["monthly_payment"]
         assert short_term["total_interest"] < long_term["total_interest"]
 
+    @pytest.mark.parametrize("terms", [[36, 0], [36, 480], [36, 60.5]])
+    def test_invalid_terms_rejected(self, terms):
+        """Zero, out-of-range and fractional terms should raise ValueError."""
+        with pytest.raises(ValueError):
+            compare_car_loan_terms(car_price=100_000, annual_interest_rate=0.0, terms=terms)
+
 
 # =============================================================================
 # EARLY PAYOFF TESTS
@@ -485,6 +491,11 @@ class TestGetCalculator:
         with pytest.raises(ValueError):
             get_calculator("invalid_type")
 
+    def test_reuses_instance_per_loan_type(self):
+        """Enum and string lookups should share one cached instance."""
+        assert get_calculator(LoanType.AUTO) is get_calculator("AUTO")
+        assert get_calculator(LoanType.AUTO) is not get_calculator(LoanType.MORTGAGE)
+
 
 # =============================================================================
 # INTEGRATION TESTS
@@ -294,6 +294,40 @@ class TestAmortizationSchedule:
         assert abs(total_from_schedule - schedule.summary.total_payment) < 1.0
 
 
+class TestCompareLoanOptions:
+    """Loan term comparison tests"""
+
+    @pytest.fixture
+    def calculator(self):
+        return LoanCalculatorTool(max_dti_ratio=0.43)
+
+    def test_matches_single_term_calculation(self, calculator):
+        """Test each compared term matches calculate_monthly_payment"""
+        terms = [36, 60, 12]
+        comparison = calculator.compare_loan_options(50000, 0.05, terms)
+
+        assert list(comparison["term_months"]) == terms
+        for term, row in zip(terms, comparison.itertuples()):
+            single = calculator.calculate_monthly_payment(
+                LoanRequest(loan_amount=50000, annual_interest_rate=0.05, loan_term_months=term)
+            )
+            assert row.monthly_payment == pytest.approx(single.monthly_payment)
+            assert row.total_interest == pytest.approx(single.total_interest)
+
+    def test_zero_interest_rate(self, calculator):
+        """Test zero-rate comparison has no interest"""
+        comparison = calculator.compare_loan_options(12000, 0.0, [12, 24])
+
+        assert list(comparison["monthly_payment"]) == [1000, 500]
+        assert (comparison["total_interest"] == 0).all()
+
+    @pytest.mark.parametrize("terms", [[36, 480], [36, 60.5]])
+    def test_invalid_term(self, calculator, terms):
+        """Test out-of-range and fractional terms are rejected"""
+        with pytest.raises(ValueError):
+            calculator.compare_loan_options(50000, 0.05, terms)
+
+
 if __name__ == "__main__":
     # Can run this file directly for testing
     pytest.main([__file__, "-v", "-s"])
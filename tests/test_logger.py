@@ -0,0 +1,73 @@
+"""Unit tests for the logging setup.
+
+Covers queued loggers, which write through the shared background
+QueueListener, against the same records seen by direct loggers.
+"""
+
+import logging
+
+import pytest
+from src.utils import logger as logger_module
+from src.utils.logger import setup_logger
+
+
+@pytest.fixture
+def queued_file_logger(tmp_path):
+    """Create a queued logger writing to a temporary file."""
+    names = []
+
+    def make(name, filename="queued.log"):
+        log_file = tmp_path / filename
+        names.append(name)
+        logger = setup_logger(
+            name, level="DEBUG", log_file=str(log_file), console_output=False, queued=True
+        )
+        return logger, log_file
+
+    yield make
+
+    logger_module._stop_listener()
+    for name in names:
+        logger_module._queued_handlers.pop(name, None)
+        logging.getLogger(name).handlers.clear()
+
+
+def read_log(log_file):
+    """Flush the shared listener and return the log file contents."""
+    logger_module._stop_listener()
+    logger_module._start_listener()
+    return log_file.read_text(encoding="utf-8")
+
+
+class TestQueuedLogger:
+    """Queued logger delivery tests"""
+
+    def test_own_records_are_written(self, queued_file_logger):
+        """Test records logged on a queued logger reach its handlers"""
+        logger, log_file = queued_file_logger("test_queued_own")
+        logger.info("own record")
+
+        assert "own record" in read_log(log_file)
+
+    def test_child_records_are_written(self, queued_file_logger):
+        """Test records propagating from a child logger are not dropped"""
+        _, log_file = queued_file_logger("test_queued_parent")
+        logging.getLogger("test_queued_parent.child").warning("child record")
+
+        contents = read_log(log_file)
+        assert "child record" in contents
+        assert "test_queued_parent.child" in contents
+
+    def test_reconfiguration_keeps_routing(self, queued_file_logger):
+        """Test reconfigured loggers flush old records and route new ones"""
+        logger, first_file = queued_file_logger("test_queued_reconfig", "first.log")
+        logger.info("before reconfigure")
+        logger, second_file = queued_file_logger("test_queued_reconfig", "second.log")
+        logger.info("after reconfigure")
+        logging.getLogger("test_queued_reconfig.child").info("child after reconfigure")
+
+        second = read_log(second_file)
+        assert "before reconfigure" in first_file.read_text(encoding="utf-8")
+        assert "after reconfigure" in second
+        assert "child after reconfigure" in second
+        assert "before reconfigure" not in second